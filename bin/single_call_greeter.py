@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """Single-call greeter - Makes 1 LLM call that invokes all 4 tools."""
 
+import asyncio
 import os
 import sys
-import time
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -11,7 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # pylint: disable=wrong-import-position,import-error
 from dotenv import load_dotenv
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, ToolMessage
 from src.hello_phoenix.tracing import setup_tracing
 from src.hello_phoenix.agent import create_greeting_agent
 # pylint: enable=wrong-import-position,import-error
@@ -19,44 +19,64 @@ from src.hello_phoenix.agent import create_greeting_agent
 # Load configuration from .env file
 load_dotenv()
 
+# uvloop's C event loop trims overhead from the many awaits LangGraph
+# issues internally; purely optional (install via the "speed" extra)
+try:
+    import uvloop
 
-def main():
+    uvloop.install()
+except ImportError:
+    pass
+
+# Single prompt asking for all 4 greetings at once; constant, so built
+# once at import rather than on every main() call
+_COMBINED_PROMPT = """Please greet the following people in their respective languages:
+    1. Alice in English
+    2. Bob in Spanish
+    3. Chen in Mandarin
+    4. David in Hebrew
+
+    Use the appropriate greeting tool for each person."""
+
+
+async def main():
     """Run the single-call greeter demo."""
     # Setup tracing with specific project name
-    setup_tracing(project_name="single-call-greeter")
+    tracer_provider = setup_tracing(project_name="single-call-greeter")
     # Create the greeting agent
     agent = create_greeting_agent(os.getenv("OPENAI_API_KEY"))
     print("🚀 Single-Call Greeter - 1 LLM Call Demo")
     print("-" * 50)
-    # Single prompt asking for all 4 greetings at once
-    combined_prompt = """Please greet the following people in their respective languages:
-    1. Alice in English
-    2. Bob in Spanish  
-    3. Chen in Mandarin
-    4. David in Hebrew
-    
-    Use the appropriate greeting tool for each person."""
     print("\n📝 Combined Prompt:")
-    print(combined_prompt)
+    print(_COMBINED_PROMPT)
     print("\n" + "-" * 50)
-    # Make a single agent invocation
-    state = {"messages": [HumanMessage(content=combined_prompt)]}
-    result = agent.invoke(state)
-    # Print all responses
+    # Stream the single agent invocation so model tokens appear as they
+    # arrive instead of blocking until the full response is ready
+    state = {"messages": [HumanMessage(content=_COMBINED_PROMPT)]}
+    greetings = []
+    async for event in agent.astream_events(state, version="v2"):
+        kind = event["event"]
+        if kind == "on_chat_model_stream":
+            chunk = event["data"]["chunk"]
+            if chunk.content:
+                print(chunk.content, end="", flush=True)
+        elif kind == "on_tool_end":
+            # Tool messages carry the greetings - no string heuristics needed
+            output = event["data"]["output"]
+            greetings.append(
+                output.content if isinstance(output, ToolMessage) else output
+            )
     print("\n🌍 Greetings Generated:")
-    for msg in result["messages"]:
-        if hasattr(msg, "content") and msg.content:
-            # Skip the initial AI message planning the tool calls
-            if not msg.content.startswith("I'll") and not msg.content.startswith(
-                "I will"
-            ):
-                print(f"   • {msg.content}")
-    # Give time for traces to be sent
-    print("\n⏳ Waiting for traces to be sent...")
-    time.sleep(2)
+    for greeting in greetings:
+        print(f"   • {greeting}")
+    # Flush the span batch queue instead of sleeping a fixed 2 seconds
+    if tracer_provider is not None:
+        print("\n⏳ Flushing traces...")
+        tracer_provider.force_flush(5_000)
+        tracer_provider.shutdown()
     print(f"\n📈 View traces at: {os.getenv('PHOENIX_HOST', 'http://localhost:6006')}")
     print("📊 Go to Projects → single-call-greeter to see 1 LLM call and 4 tool calls")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -13,10 +13,12 @@ setup(
     install_requires=[
         "python-dotenv>=1.1.1",
         "openai>=1.101.0",
+        "httpx[http2]>=0.27.0",
         "arize-phoenix-otel>=0.13.0",
         "openinference-instrumentation-openai>=0.1.31",
         "openinference-instrumentation-langchain>=0.1.50",
         "langchain>=0.3.27",
+        "langchain-community>=0.3.31",
         "langchain-openai>=0.3.31",
         "langgraph>=0.6.6",
     ],
@@ -24,6 +26,9 @@ setup(
         "dev": [
             "pytest>=8.4.1",
             "pytest-asyncio>=1.1.0",
-        ]
+        ],
+        "speed": [
+            'uvloop; python_version<"3.14"',
+        ],
     },
 )
@@ -1,8 +1,32 @@
 """Greeting tools for different languages."""
 
+import functools
+
 from langchain_core.tools import tool
 
 
+# The greetings are pure functions of the name, so cache the formatted
+# strings and let repeat calls for the same name skip the f-string work
+@functools.lru_cache(maxsize=512)
+def _hello_english(name):
+    return f"Hello {name}"
+
+
+@functools.lru_cache(maxsize=512)
+def _hello_mandarin(name):
+    return f"你好 {name}"
+
+
+@functools.lru_cache(maxsize=512)
+def _hello_spanish(name):
+    return f"Hola {name}"
+
+
+@functools.lru_cache(maxsize=512)
+def _hello_hebrew(name):
+    return f"שלום {name}"
+
+
 @tool
 def hello_english(name: str) -> str:
     """Greet someone in English.
@@ -13,7 +37,7 @@ def hello_english(name: str) -> str:
     Returns:
         Greeting in English
     """
-    return f"Hello {name}"
+    return _hello_english(name)
 
 
 @tool
@@ -26,7 +50,7 @@ def hello_mandarin(name: str) -> str:
     Returns:
         Greeting in Mandarin (你好)
     """
-    return f"你好 {name}"
+    return _hello_mandarin(name)
 
 
 @tool
@@ -39,7 +63,7 @@ def hello_spanish(name: str) -> str:
     Returns:
         Greeting in Spanish
     """
-    return f"Hola {name}"
+    return _hello_spanish(name)
 
 
 @tool
@@ -52,7 +76,7 @@ def hello_hebrew(name: str) -> str:
     Returns:
         Greeting in Hebrew (שלום)
     """
-    return f"שלום {name}"
+    return _hello_hebrew(name)
 
 
 def get_all_tools():
@@ -4,23 +4,48 @@ import os
 
 # pylint: disable=import-error
 from dotenv import load_dotenv
-from phoenix.otel import register
-from openinference.instrumentation.openai import OpenAIInstrumentor
-from openinference.instrumentation.langchain import LangChainInstrumentor
 # pylint: enable=import-error
 
 
-def setup_tracing(project_name="hello-phoenix"):
+def tracing_enabled():
+    """Check whether Phoenix tracing is configured.
+
+    Tracing is considered enabled when either PHOENIX_COLLECTOR_ENDPOINT
+    or PHOENIX_API_KEY is set; otherwise instrumentation is skipped
+    entirely so uninstrumented runs pay zero tracing overhead.
+    """
+    return bool(
+        os.getenv("PHOENIX_COLLECTOR_ENDPOINT") or os.getenv("PHOENIX_API_KEY")
+    )
+
+
+def setup_tracing(project_name="hello-phoenix", sample_rate=1.0):
     """Setup Phoenix tracing for OpenAI and LangChain.
 
     Args:
         project_name: The Phoenix project name for organizing traces
+        sample_rate: Fraction of traces to record (0.0-1.0). Rates below
+            1.0 install a ParentBased(TraceIdRatioBased) sampler so
+            unsampled traces skip span recording entirely
 
     Returns:
-        tracer_provider: The OpenTelemetry tracer provider
+        tracer_provider: The OpenTelemetry tracer provider, or None when
+            tracing is not configured (callers should skip force_flush)
     """
     load_dotenv()
 
+    if not tracing_enabled():
+        print("🚫 Tracing disabled (set PHOENIX_COLLECTOR_ENDPOINT to enable)")
+        return None
+
+    # Import lazily so scripts that never trace skip the import cost
+    # pylint: disable=import-error,import-outside-toplevel
+    from phoenix.otel import register
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from openinference.instrumentation.openai import OpenAIInstrumentor
+    from openinference.instrumentation.langchain import LangChainInstrumentor
+    # pylint: enable=import-error,import-outside-toplevel
+
     endpoint = os.getenv(
         "PHOENIX_COLLECTOR_ENDPOINT", "http://localhost:6006/v1/traces"
     )
@@ -28,10 +53,18 @@ def setup_tracing(project_name="hello-phoenix"):
     print(f"📡 Setting up tracing to: {endpoint}")
     print(f"📊 Phoenix Project: {project_name}")
 
+    # register() forwards extra kwargs to the underlying TracerProvider,
+    # so a sampler can be installed without building the provider by hand
+    provider_kwargs = {}
+    if sample_rate < 1.0:
+        provider_kwargs["sampler"] = ParentBased(TraceIdRatioBased(sample_rate))
+        print(f"🎯 Sampling {sample_rate:.0%} of traces")
+
     tracer_provider = register(
         project_name=project_name,
         endpoint=endpoint,
         auto_instrument=False,  # Disable auto-instrumentation to avoid conflicts
+        **provider_kwargs,
     )
 
     # Manually instrument only if not already instrumented
@@ -1,14 +1,30 @@
 """Tests for the greeting agent."""
 
 import pytest
-from unittest.mock import patch, MagicMock
-from langchain_core.messages import HumanMessage
+from unittest.mock import MagicMock
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from src.hello_phoenix.agent import create_greeting_agent
 
 
+def make_fake_llm(response):
+    """Build an in-process fake chat model returning a fixed response."""
+    fake_llm = MagicMock()
+    fake_llm.bind_tools.return_value.invoke.return_value = response
+    return fake_llm
+
+
 class TestGreetingAgent:
     """Test suite for greeting agent."""
 
+    @pytest.fixture(autouse=True)
+    def clear_agent_cache(self):
+        """Clear the memoized workflow so each test builds a fresh agent."""
+        from src.hello_phoenix.agent import _build
+
+        _build.cache_clear()
+        yield
+        _build.cache_clear()
+
     @pytest.fixture
     def mock_api_key(self):
         """Mock OpenAI API key."""
@@ -19,22 +35,37 @@ class TestGreetingAgent:
         agent = create_greeting_agent(mock_api_key)
         assert agent is not None
 
-    @patch("src.hello_phoenix.agent.ChatOpenAI")
-    def test_agent_uses_tools(self, mock_llm, mock_api_key):
-        """Test that agent uses tools for greetings."""
-        mock_response = MagicMock()
-        mock_response.tool_calls = [{"name": "hello_english", "args": {"name": "Test"}}]
-
-        mock_llm_instance = MagicMock()
-        mock_llm_instance.bind_tools.return_value.invoke.return_value = mock_response
-        mock_llm.return_value = mock_llm_instance
+    def test_agent_uses_tools(self):
+        """Test that agent executes the tool calls the model emits."""
+        response = AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "hello_english", "args": {"name": "Test"}, "id": "call-1"}
+            ],
+        )
 
-        agent = create_greeting_agent(mock_api_key)
+        agent = create_greeting_agent(llm=make_fake_llm(response))
 
         state = {"messages": [HumanMessage(content="Say hello to Test in English")]}
 
         result = agent.invoke(state)
         assert "messages" in result
+        tool_messages = [
+            msg for msg in result["messages"] if isinstance(msg, ToolMessage)
+        ]
+        assert len(tool_messages) == 1
+        assert tool_messages[0].content == "Hello Test"
+
+    def test_agent_ends_without_tool_calls(self):
+        """Test that a plain response ends the graph without a tool step."""
+        response = AIMessage(content="Hi there!")
+
+        agent = create_greeting_agent(llm=make_fake_llm(response))
+
+        state = {"messages": [HumanMessage(content="Just say hi")]}
+
+        result = agent.invoke(state)
+        assert result["messages"][-1].content == "Hi there!"
 
     def test_agent_state_structure(self):
         """Test AgentState structure."""
@@ -1 +0,0 @@
-# Agent tools package
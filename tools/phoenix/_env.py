@@ -0,0 +1,24 @@
+"""Shared .env loading for Phoenix tools, parsed at most once."""
+
+import os
+
+# pylint: disable=import-error
+from dotenv import load_dotenv
+# pylint: enable=import-error
+
+# Sentinel set after the first load so agent loops spawning these tools
+# back-to-back don't re-read and re-parse .env from disk on every run
+_SENTINEL = "PHOENIX_ENV_LOADED"
+
+
+def ensure_env():
+    """Load .env once per environment, skipping when already configured.
+
+    Short-circuits when PHOENIX_HOST is already set (the parent shell or
+    a previous tool did the work) or when the sentinel marks a prior
+    load; otherwise parses .env and sets the sentinel.
+    """
+    if os.environ.get(_SENTINEL) or os.environ.get("PHOENIX_HOST"):
+        return
+    load_dotenv(override=False)
+    os.environ[_SENTINEL] = "1"
@@ -3,24 +3,49 @@
 
 import argparse
 import json
-import os
 import sys
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports (once per interpreter)
+_PARENT = str(Path(__file__).parent.parent)
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 # pylint: disable=import-error,wrong-import-position
-from dotenv import load_dotenv
+from phoenix._env import ensure_env
 from phoenix.graphql_utils import (
-    get_project_id,
+    DEFAULT_ENDPOINT,
     execute_graphql_query,
     get_project_input_schema,
     get_endpoint_input_schema,
 )
 # pylint: enable=import-error,wrong-import-position
 
-load_dotenv()
+ensure_env()
+
+# Query strings live at module level so each invocation reuses the same
+# str object instead of rebuilding it per call
+GET_PROJECTS_WITH_COUNTS_QUERY = """
+query GetProjects {
+    projects {
+        edges {
+            node {
+                id
+                name
+                traceCount
+            }
+        }
+    }
+}
+"""
+
+CLEAR_PROJECT_MUTATION = """
+mutation ClearProject($input: ClearProjectInput!) {
+    clearProject(input: $input) {
+        __typename
+    }
+}
+"""
 
 
 def get_context():
@@ -47,33 +72,25 @@ def get_context():
     }
 
 
-def get_trace_count(project_id, endpoint):
-    """Get trace count for a project using GraphQL."""
-    # Since project(id:) query doesn't work, get it from projects list
-    query = """
-    query GetProjects {
-        projects {
-            edges {
-                node {
-                    id
-                    name
-                    traceCount
-                }
-            }
-        }
-    }
-    """
+def _fetch_project(project_name, endpoint):
+    """Get project ID and trace count in a single GraphQL round-trip.
 
-    response = execute_graphql_query(endpoint, query)
+    Since project(id:) query doesn't work, both come from the projects
+    list - previously fetched twice, once per value.
+
+    Returns:
+        (project_id, trace_count) tuple; (None, 0) if not found
+    """
+    response = execute_graphql_query(endpoint, GET_PROJECTS_WITH_COUNTS_QUERY)
 
-    if response.status_code == 200:
-        result = response.json()
+    if response.status_code == 200 and response.data is not None:
+        result = response.data
         if "data" in result and result["data"] and "projects" in result["data"]:
             edges = result["data"]["projects"]["edges"]
             for edge in edges:
-                if edge["node"]["id"] == project_id:
-                    return edge["node"].get("traceCount", 0) or 0
-    return 0
+                if edge["node"]["name"] == project_name:
+                    return edge["node"]["id"], edge["node"].get("traceCount", 0) or 0
+    return None, 0
 
 
 def delete_traces(project_name, endpoint=None, confirm=False):
@@ -83,12 +100,11 @@ def delete_traces(project_name, endpoint=None, confirm=False):
     while keeping the project intact.
     """
 
-    if not endpoint:
-        endpoint = os.getenv("PHOENIX_HOST", "http://localhost:6006")
+    endpoint = endpoint or DEFAULT_ENDPOINT
 
     try:
-        # Get project ID
-        project_id = get_project_id(project_name, endpoint)
+        # Get project ID and pre-deletion trace count in one round-trip
+        project_id, trace_count = _fetch_project(project_name, endpoint)
 
         if not project_id:
             return {
@@ -98,9 +114,6 @@ def delete_traces(project_name, endpoint=None, confirm=False):
                 "project": project_name,
             }
 
-        # Get trace count before deletion
-        trace_count = get_trace_count(project_id, endpoint)
-
         if trace_count == 0:
             return {
                 "success": True,
@@ -110,20 +123,12 @@ def delete_traces(project_name, endpoint=None, confirm=False):
             }
 
         # Use GraphQL mutation to clear the project
-        mutation = """
-        mutation ClearProject($input: ClearProjectInput!) {
-            clearProject(input: $input) {
-                __typename
-            }
-        }
-        """
-
         variables = {"input": {"id": project_id}}
 
-        response = execute_graphql_query(endpoint, mutation, variables)
+        response = execute_graphql_query(endpoint, CLEAR_PROJECT_MUTATION, variables)
 
         if response.status_code == 200:
-            result = response.json()
+            result = response.data
             if (
                 result
                 and "data" in result
@@ -1,71 +1,296 @@
 """Shared GraphQL utilities for Phoenix tools."""
 
+import atexit
+import os
+import time
+from collections import namedtuple
+
 # pylint: disable=import-error
 import requests
+
+from phoenix._env import ensure_env
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 # pylint: enable=import-error
 
+# .env must be in place before any endpoint/TTL defaults are read
+ensure_env()
+
+# Resolved once at import so the per-call os.environ lookup goes away
+DEFAULT_ENDPOINT = os.getenv("PHOENIX_HOST", "http://localhost:6006")
+
+# Span payloads repeat the same keys on every node, so gzip cuts
+# transfer size drastically; both clients decompress transparently
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# One session for all GraphQL calls, so back-to-back queries reuse the
+# same TCP/TLS connection instead of paying a handshake per POST
+_SESSION = requests.Session()
+_SESSION.headers.update({**_BASE_HEADERS, "Connection": "keep-alive"})
+_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+atexit.register(_SESSION.close)
+
+# Preferred transport: HTTP/2 multiplexes concurrent POSTs (the thread
+# pool in list_traces_batch) over one connection instead of serializing
+# them per-socket. Connection is a hop-by-hop HTTP/1.1 header, so the
+# httpx client only gets the base headers. Falls back to the requests
+# session when httpx or its h2 extra is missing
+_HTTPX_CLIENT = None
+if httpx is not None:
+    try:
+        _HTTPX_CLIENT = httpx.Client(http2=True, timeout=30.0, headers=_BASE_HEADERS)
+        atexit.register(_HTTPX_CLIENT.close)
+    except ImportError:
+        _HTTPX_CLIENT = None
+
 
 def get_graphql_endpoint(endpoint):
     """Get the GraphQL endpoint URL from base endpoint."""
     return f"{endpoint}/graphql"
 
 
+# Parsed GraphQL response: data is the decoded JSON body (None when the
+# body was not JSON); text is only populated on failures for error
+# messages, so the success path skips decoding the raw bytes twice
+GraphQLResponse = namedtuple("GraphQLResponse", ["status_code", "data", "text"])
+
+
+def _decode_body(response):
+    """Decode a response body, preferring orjson's C parser."""
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return None
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
+
 def execute_graphql_query(endpoint, query, variables=None):
     """Execute a GraphQL query against Phoenix server.
-    
+
     Args:
         endpoint: Phoenix server base endpoint
         query: GraphQL query string
         variables: Optional query variables
-        
+
     Returns:
-        Response object from requests.post
+        GraphQLResponse with status_code, decoded data, and error text
     """
     graphql_endpoint = get_graphql_endpoint(endpoint)
     payload = {"query": query}
     if variables:
         payload["variables"] = variables
-    
-    return requests.post(
-        graphql_endpoint,
-        json=payload,
-        headers={"Content-Type": "application/json"},
-    )
+
+    # orjson encodes 2-5x faster than the stdlib encoder the clients
+    # use; the Content-Type default lives on the client headers
+    body = orjson.dumps(payload) if orjson is not None else None
+
+    if _HTTPX_CLIENT is not None:
+        if body is not None:
+            raw = _HTTPX_CLIENT.post(graphql_endpoint, content=body)
+        else:
+            raw = _HTTPX_CLIENT.post(graphql_endpoint, json=payload)
+    elif body is not None:
+        raw = _SESSION.post(graphql_endpoint, data=body)
+    else:
+        raw = _SESSION.post(graphql_endpoint, json=payload)
+
+    data = _decode_body(raw)
+    text = raw.text if (raw.status_code != 200 or data is None) else ""
+    return GraphQLResponse(raw.status_code, data, text)
+
+
+async def async_execute_graphql_query(session, endpoint, query, variables=None):
+    """Execute a GraphQL query over an aiohttp ClientSession.
+
+    Args:
+        session: Shared aiohttp.ClientSession
+        endpoint: Phoenix server base endpoint
+        query: GraphQL query string
+        variables: Optional query variables
+
+    Returns:
+        (status, result) tuple with the HTTP status code and the decoded
+        JSON body (None when the body is not JSON)
+    """
+    payload = {"query": query}
+    if variables:
+        payload["variables"] = variables
+
+    async with session.post(get_graphql_endpoint(endpoint), json=payload) as response:
+        try:
+            result = await response.json()
+        except Exception:  # pylint: disable=broad-exception-caught
+            result = None
+        return response.status, result
+
+
+# Project IDs are effectively immutable, so memoize name->id lookups
+# with a TTL and skip a full projects round-trip on repeat calls
+_PROJECT_ID_TTL = float(os.getenv("PHOENIX_PROJECT_ID_TTL", "300"))
+_PROJECT_ID_CACHE = {}
+
+# Ask the server to filter by name so only one project crosses the wire;
+# set to False after the first "unknown field/argument" rejection
+_FILTERED_LOOKUP_SUPPORTED = True
+
+# Full listing used when the server rejects the filtered lookup
+GET_PROJECT_IDS_QUERY = """
+query GetProjects {
+    projects {
+        edges {
+            node {
+                id
+                name
+            }
+        }
+    }
+}
+"""
+
+GET_PROJECT_BY_NAME_QUERY = """
+query GetProjectByName($name: String!) {
+    projects(filter: {col: name, value: $name}) {
+        edges {
+            node {
+                id
+                name
+            }
+        }
+    }
+}
+"""
+
+
+def invalidate_project_cache():
+    """Clear cached project ID lookups (for tests and deleted projects)."""
+    _PROJECT_ID_CACHE.clear()
 
 
 def get_project_id(project_name, endpoint):
     """Get project ID by name using GraphQL.
-    
+
+    Results are cached per (endpoint, project_name) for
+    PHOENIX_PROJECT_ID_TTL seconds (default 300).
+
     Args:
         project_name: Name of the Phoenix project
         endpoint: Phoenix server endpoint
-        
+
     Returns:
         Project ID string or None if not found
     """
-    query = """
-    query GetProjects {
-        projects {
-            edges {
-                node {
-                    id
-                    name
-                }
+    global _FILTERED_LOOKUP_SUPPORTED  # pylint: disable=global-statement
+
+    cache_key = (endpoint, project_name)
+    cached = _PROJECT_ID_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _PROJECT_ID_TTL:
+        return cached[1]
+
+    if _FILTERED_LOOKUP_SUPPORTED:
+        response = execute_graphql_query(
+            endpoint, GET_PROJECT_BY_NAME_QUERY, {"name": project_name}
+        )
+        if response.status_code == 200 and response.data is not None:
+            result = response.data
+            if "errors" in result and result["errors"]:
+                # Server doesn't know the filter argument - remember and
+                # fall through to the full listing
+                _FILTERED_LOOKUP_SUPPORTED = False
+            else:
+                edges = result.get("data", {}).get("projects", {}).get("edges", [])
+                for edge in edges:
+                    if edge["node"]["name"] == project_name:
+                        project_id = edge["node"]["id"]
+                        _PROJECT_ID_CACHE[cache_key] = (
+                            time.monotonic(),
+                            project_id,
+                        )
+                        return project_id
+                return None
+
+    response = execute_graphql_query(endpoint, GET_PROJECT_IDS_QUERY)
+
+    if response.status_code == 200 and response.data is not None:
+        result = response.data
+        if "data" in result:
+            edges = result["data"]["projects"]["edges"]
+            # Build the full name->id map once and cache every entry, so
+            # repeated lookups are O(1) instead of a linear rescan
+            now = time.monotonic()
+            name_to_id = {e["node"]["name"]: e["node"]["id"] for e in edges}
+            for name, project_id in name_to_id.items():
+                _PROJECT_ID_CACHE[(endpoint, name)] = (now, project_id)
+            return name_to_id.get(project_name)
+    return None
+
+
+# Root query fields per endpoint, introspected once per process. When
+# the shape is confirmed, parsers can index responses directly instead
+# of walking defensive .get chains on every node
+_SCHEMA_ROOT_FIELDS = {}
+
+SCHEMA_ROOT_FIELDS_QUERY = """
+query SchemaRootFields {
+    __schema {
+        queryType {
+            fields {
+                name
             }
         }
     }
+}
+"""
+
+
+def ensure_schema(endpoint):
+    """Get the root query fields exposed by a Phoenix endpoint.
+
+    Runs one introspection query per endpoint per process and caches
+    the result. Returns an empty frozenset when introspection fails,
+    which keeps callers on their defensive parsing paths.
+
+    Args:
+        endpoint: Phoenix server endpoint
+
+    Returns:
+        Frozenset of root query field names
     """
-    
-    response = execute_graphql_query(endpoint, query)
-    
-    if response.status_code == 200:
-        result = response.json()
-        if "data" in result:
-            edges = result["data"]["projects"]["edges"]
-            for edge in edges:
-                if edge["node"]["name"] == project_name:
-                    return edge["node"]["id"]
-    return None
+    cached = _SCHEMA_ROOT_FIELDS.get(endpoint)
+    if cached is not None:
+        return cached
+
+    fields = frozenset()
+    try:
+        response = execute_graphql_query(endpoint, SCHEMA_ROOT_FIELDS_QUERY)
+        if response.status_code == 200 and response.data is not None:
+            result = response.data
+            if not result.get("errors"):
+                fields = frozenset(
+                    field["name"]
+                    for field in result["data"]["__schema"]["queryType"]["fields"]
+                )
+    except Exception:  # pylint: disable=broad-exception-caught
+        fields = frozenset()
+
+    _SCHEMA_ROOT_FIELDS[endpoint] = fields
+    return fields
 
 
 def get_project_input_schema():
@@ -2,22 +2,68 @@
 """List all Phoenix projects."""
 
 import argparse
+import asyncio
 import json
-import os
 import sys
 from pathlib import Path
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports (once per interpreter)
+_PARENT = str(Path(__file__).parent.parent)
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 # pylint: disable=import-error,wrong-import-position
-from dotenv import load_dotenv
+from phoenix._env import ensure_env
 from phoenix.graphql_utils import (
+    DEFAULT_ENDPOINT,
+    ensure_schema,
     execute_graphql_query,
+    async_execute_graphql_query,
     get_endpoint_input_schema,
 )
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 # pylint: enable=import-error,wrong-import-position
 
-load_dotenv()
+ensure_env()
+
+
+def _emit(result):
+    """Write a result dict to stdout as indented JSON.
+
+    orjson serializes large dicts an order of magnitude faster than the
+    stdlib encoder and writing bytes directly skips the str encode.
+    """
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+    else:
+        print(json.dumps(result, indent=2))
+
+
+GET_PROJECTS_QUERY = """
+query GetProjects {
+    projects {
+        edges {
+            node {
+                id
+                name
+                createdAt
+                traceCount
+                recordCount
+                tokenCountTotal
+            }
+        }
+    }
+}
+"""
 
 
 def get_context():
@@ -35,65 +81,58 @@ def get_context():
     }
 
 
-def list_projects(endpoint=None):
-    """List all Phoenix projects using GraphQL API."""
-
-    if not endpoint:
-        endpoint = os.getenv("PHOENIX_HOST", "http://localhost:6006")
-
-    try:
-        # GraphQL query to get all projects
-        query = """
-        query GetProjects {
-            projects {
-                edges {
-                    node {
-                        id
-                        name
-                        createdAt
-                        traceCount
-                        recordCount
-                        tokenCountTotal
-                    }
-                }
-            }
-        }
-        """
-
-        response = execute_graphql_query(endpoint, query)
+def _http_error_result(status_code, text):
+    """Build the error dict for a non-200 response."""
+    return {
+        "success": False,
+        "message": f"HTTP error {status_code}: {text}",
+        "projects": [],
+        "count": 0,
+    }
 
-        if response.status_code != 200:
-            return {
-                "success": False,
-                "message": f"HTTP error {response.status_code}: {response.text}",
-                "projects": [],
-                "count": 0,
-            }
 
-        result = response.json()
+def _result_from_graphql(result, strict=False):
+    """Convert a parsed GraphQL response into the tool's output dict.
 
-        if "errors" in result and result["errors"]:
-            return {
-                "success": False,
-                "message": f"GraphQL error: {result['errors'][0]['message']}",
-                "projects": [],
-                "count": 0,
-            }
+    With strict=True the response shape is known from introspection, so
+    nodes are indexed directly rather than through .get chains.
+    """
+    if "errors" in result and result["errors"]:
+        return {
+            "success": False,
+            "message": f"GraphQL error: {result['errors'][0]['message']}",
+            "projects": [],
+            "count": 0,
+        }
 
-        # Extract projects from GraphQL response
+    # Extract projects from GraphQL response
+    if strict:
+        edges = result["data"]["projects"]["edges"]
+    else:
         edges = result.get("data", {}).get("projects", {}).get("edges", [])
 
-        if not edges:
-            return {
-                "success": True,
-                "message": "No projects found",
-                "projects": [],
-                "count": 0,
-            }
+    if not edges:
+        return {
+            "success": True,
+            "message": "No projects found",
+            "projects": [],
+            "count": 0,
+        }
 
-        # Convert projects to serializable format
-        project_list = []
-        for edge in edges:
+    # Convert projects to serializable format
+    project_list = []
+    for edge in edges:
+        if strict:
+            node = edge["node"]
+            project_dict = {
+                "name": node["name"],
+                "id": node["id"],
+                "created_at": node["createdAt"],
+                "trace_count": node["traceCount"],
+                "record_count": node["recordCount"],
+                "token_count_total": node["tokenCountTotal"],
+            }
+        else:
             node = edge.get("node", {})
             project_dict = {
                 "name": node.get("name"),
@@ -103,15 +142,71 @@ def list_projects(endpoint=None):
                 "record_count": node.get("recordCount"),
                 "token_count_total": node.get("tokenCountTotal"),
             }
-            project_list.append(project_dict)
+        project_list.append(project_dict)
+
+    return {
+        "success": True,
+        "message": f"Found {len(project_list)} projects",
+        "projects": project_list,
+        "count": len(project_list),
+    }
+
+
+def list_projects(endpoint=None):
+    """List all Phoenix projects using GraphQL API."""
+
+    endpoint = endpoint or DEFAULT_ENDPOINT
+
+    try:
+        strict = "projects" in ensure_schema(endpoint)
+        response = execute_graphql_query(endpoint, GET_PROJECTS_QUERY)
+
+        if response.status_code != 200 or response.data is None:
+            return _http_error_result(response.status_code, response.text)
 
+        return _result_from_graphql(response.data, strict)
+
+    except Exception as e:
         return {
-            "success": True,
-            "message": f"Found {len(project_list)} projects",
-            "projects": project_list,
-            "count": len(project_list),
+            "success": False,
+            "message": f"Error: {str(e)}",
+            "projects": [],
+            "count": 0,
         }
 
+
+async def list_projects_async(endpoint=None, session=None):
+    """Async variant of list_projects over a shared aiohttp session.
+
+    Callers doing several tool invocations can pass one ClientSession
+    and fan the GraphQL calls out with asyncio.gather; without a session
+    a short-lived one is created.
+    """
+
+    endpoint = endpoint or DEFAULT_ENDPOINT
+
+    try:
+        # The introspection probe shares the sync session, so run it off
+        # the event loop; it only costs a round-trip once per process
+        loop = asyncio.get_running_loop()
+        root_fields = await loop.run_in_executor(None, ensure_schema, endpoint)
+        strict = "projects" in root_fields
+
+        if session is not None:
+            status, result = await async_execute_graphql_query(
+                session, endpoint, GET_PROJECTS_QUERY
+            )
+        else:
+            async with aiohttp.ClientSession() as own_session:
+                status, result = await async_execute_graphql_query(
+                    own_session, endpoint, GET_PROJECTS_QUERY
+                )
+
+        if status != 200:
+            return _http_error_result(status, result)
+
+        return _result_from_graphql(result, strict)
+
     except Exception as e:
         return {
             "success": False,
@@ -133,14 +228,17 @@ def main():
     args = parser.parse_args()
 
     if args.context:
-        print(json.dumps(get_context(), indent=2))
+        _emit(get_context())
         return 0
 
-    # List projects
-    result = list_projects(args.endpoint)
+    # List projects, preferring the aiohttp path when available
+    if aiohttp is not None:
+        result = asyncio.run(list_projects_async(args.endpoint))
+    else:
+        result = list_projects(args.endpoint)
 
     # Output as JSON for agent consumption
-    print(json.dumps(result, indent=2))
+    _emit(result)
 
     return 0 if result["success"] else 1
 
@@ -2,30 +2,234 @@
 """List traces from a Phoenix project with optional filters."""
 
 import argparse
+import asyncio
 import json
-import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from typing import Optional
+# Add parent directory to path for imports (once per interpreter)
+_PARENT = str(Path(__file__).parent.parent)
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 # pylint: disable=import-error,wrong-import-position
-from dotenv import load_dotenv
+from phoenix._env import ensure_env
+from phoenix.list_projects import list_projects
 from phoenix.graphql_utils import (
+    DEFAULT_ENDPOINT,
+    ensure_schema,
     get_project_id,
     execute_graphql_query,
+    async_execute_graphql_query,
     get_project_input_schema,
     get_endpoint_input_schema,
 )
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 # pylint: enable=import-error,wrong-import-position
 
-load_dotenv()
+ensure_env()
+
+# Typed per-trace rows: msgspec serializes Structs straight from their
+# slots, skipping the intermediate dict allocation per trace. The dict
+# builders remain the fallback when msgspec is missing
+if msgspec is not None:
+
+    class Trace(msgspec.Struct):
+        """One trace row; field order matches _TRACE_KEYS."""
+
+        trace_id: Optional[str]
+        first_span_name: Optional[str]
+        start_time: Optional[str]
+        latency_ms: Optional[float]
+        token_count_total: Optional[int]
+        status_code: Optional[str]
+
+    class VerboseTrace(msgspec.Struct):
+        """Trace row with the --verbose extras; order matches _VERBOSE_TRACE_KEYS."""
+
+        trace_id: Optional[str]
+        first_span_name: Optional[str]
+        start_time: Optional[str]
+        latency_ms: Optional[float]
+        token_count_total: Optional[int]
+        status_code: Optional[str]
+        first_span_id: Optional[str]
+        end_time: Optional[str]
+        token_count_prompt: Optional[int]
+        token_count_completion: Optional[int]
+
+else:
+    Trace = None
+    VerboseTrace = None
+
+
+def _emit(result):
+    """Write a result dict to stdout as indented JSON.
+
+    Serialization dominates when a large traces array comes back, so
+    prefer msgspec (which also understands the Trace structs), then
+    orjson, writing bytes straight to the stdout buffer either way.
+    """
+    if msgspec is not None:
+        buf = msgspec.json.format(msgspec.json.encode(result), indent=2)
+        sys.stdout.buffer.write(buf)
+        sys.stdout.buffer.write(b"\n")
+    elif orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+    else:
+        print(json.dumps(result, indent=2))
+
+
+# Only the fields the trace dicts actually carry; fetching less means
+# fewer server resolvers, fewer bytes, and less JSON to parse
+_SPAN_FIELDS = """
+                            context {
+                                traceId
+                            }
+                            name
+                            statusCode
+                            startTime
+                            latencyMs
+                            tokenCountTotal"""
+
+# Extended selection, only fetched (and returned) with --verbose
+_VERBOSE_SPAN_FIELDS = _SPAN_FIELDS + """
+                            id
+                            endTime
+                            tokenCountPrompt
+                            tokenCountCompletion"""
+
+# Spans nested under the name-filtered projects listing, so the
+# name->spans resolution shares a single POST and only the requested
+# project's spans cross the wire; servers without the filter argument
+# reject the query and land on the two-call fallback
+_PROJECT_TRACES_TEMPLATE = """
+query GetProjectTraces($name: String!, $first: Int) {{
+    projects(filter: {{col: name, value: $name}}) {{
+        edges {{
+            node {{
+                id
+                name
+                spans(first: $first) {{
+                    edges {{
+                        node {{{span_fields}
+                        }}
+                    }}
+                }}
+            }}
+        }}
+    }}
+}}
+"""
+
+GET_PROJECT_TRACES_QUERY = _PROJECT_TRACES_TEMPLATE.format(span_fields=_SPAN_FIELDS)
+GET_PROJECT_TRACES_QUERY_VERBOSE = _PROJECT_TRACES_TEMPLATE.format(
+    span_fields=_VERBOSE_SPAN_FIELDS
+)
+
+
+# Static text with variables, so every invocation sends the identical
+# query string and the server's parsed-query/plan cache can hit
+_TRACES_TEMPLATE = """
+query GetTraces($projectId: ID!, $first: Int, $after: String) {{
+    project(id: $projectId) {{
+        spans(first: $first, after: $after) {{
+            pageInfo {{
+                hasNextPage
+                endCursor
+            }}
+            edges {{
+                node {{{span_fields}
+                }}
+            }}
+        }}
+    }}
+}}
+"""
+
+GET_TRACES_QUERY = _TRACES_TEMPLATE.format(span_fields=_SPAN_FIELDS)
+GET_TRACES_QUERY_VERBOSE = _TRACES_TEMPLATE.format(span_fields=_VERBOSE_SPAN_FIELDS)
+
+# Page size for the cursor walk; small enough to bound each response,
+# large enough that most projects resolve in one or two round-trips
+_PAGE_SIZE = 100
+
+# One C-level itemgetter call per span instead of five method
+# dispatches; output keys and span fields stay positionally aligned
+_TRACE_KEYS = (
+    "first_span_name",
+    "start_time",
+    "latency_ms",
+    "token_count_total",
+    "status_code",
+)
+_SPAN_FIELD_NAMES = ("name", "startTime", "latencyMs", "tokenCountTotal", "statusCode")
+_SPAN_GET = itemgetter(*_SPAN_FIELD_NAMES)
+_VERBOSE_TRACE_KEYS = _TRACE_KEYS + (
+    "first_span_id",
+    "end_time",
+    "token_count_prompt",
+    "token_count_completion",
+)
+_VERBOSE_SPAN_FIELD_NAMES = _SPAN_FIELD_NAMES + (
+    "id",
+    "endTime",
+    "tokenCountPrompt",
+    "tokenCountCompletion",
+)
+_VERBOSE_SPAN_GET = itemgetter(*_VERBOSE_SPAN_FIELD_NAMES)
+
+# Some Phoenix versions expose distinct traces as their own connection,
+# so the server does the dedup and only one row per trace crosses the
+# wire. Probe once per process: None until tried, then True/False
+_TRACES_CONNECTION_SUPPORTED = None
+
+GET_PROJECT_TRACE_NODES_QUERY = """
+query GetProjectTraceNodes($projectId: ID!, $first: Int) {
+    project(id: $projectId) {
+        traces(first: $first) {
+            edges {
+                node {
+                    traceId
+                    rootSpan {
+                        name
+                        statusCode
+                        startTime
+                        latencyMs
+                        tokenCountTotal
+                    }
+                }
+            }
+        }
+    }
+}
+"""
 
 
 def get_context():
     """Return tool capabilities for agent discovery."""
     inputs = {}
     inputs.update(get_project_input_schema())
+    # all_projects may stand in for a project name
+    inputs["project"]["required"] = False
     inputs.update(get_endpoint_input_schema())
     inputs["limit"] = {
         "type": "integer",
@@ -37,7 +241,22 @@ def get_context():
         "required": False,
         "description": "Filter condition for traces",
     }
-    
+    inputs["all_projects"] = {
+        "type": "boolean",
+        "required": False,
+        "description": "List traces for every project in parallel",
+    }
+    inputs["target_traces"] = {
+        "type": "integer",
+        "required": False,
+        "description": "Paginate spans and stop after this many unique traces",
+    }
+    inputs["verbose"] = {
+        "type": "boolean",
+        "required": False,
+        "description": "Include span ID, end time, and token breakdown per trace",
+    }
+
     return {
         "capability": "list_traces",
         "inputs": inputs,
@@ -52,128 +271,446 @@ def get_context():
     }
 
 
-def list_traces(project_name, limit=None, filter_condition=None, endpoint=None):
+def _error_result(project_name, message):
+    """Build the error dict the tool returns on any failure."""
+    return {
+        "success": False,
+        "message": message,
+        "traces": [],
+        "count": 0,
+        "project": project_name,
+    }
+
+
+def _extract_spans_edges(project_name, result, strict=False):
+    """Pull the matching project's span edges from the nested response.
+
+    Returns:
+        (spans_edges, error) - exactly one is None
+    """
+    if strict:
+        project_edges = result["data"]["projects"]["edges"]
+        for edge in project_edges:
+            if edge["node"]["name"] == project_name:
+                return edge["node"]["spans"]["edges"], None
+    else:
+        project_edges = result.get("data", {}).get("projects", {}).get("edges", [])
+        for edge in project_edges:
+            if edge.get("node", {}).get("name") == project_name:
+                return edge["node"].get("spans", {}).get("edges", []), None
+    return None, _error_result(project_name, f"Project '{project_name}' not found")
+
+
+def _result_from_spans_edges(
+    project_name, spans_edges, verbose=False, strict=False, max_traces=None
+):
+    """Group span edges by trace ID into the tool's output dict.
+
+    With strict=True the response shape is known from introspection, so
+    span nodes are indexed directly rather than through .get chains.
+    max_traces caps the result: the pagination loop may overshoot its
+    target on the final page.
+    """
+    if not spans_edges:
+        return {
+            "success": True,
+            "message": f"No traces found in project '{project_name}'",
+            "traces": [],
+            "count": 0,
+            "project": project_name,
+        }
+
+    # First span per trace wins: a plain set for membership plus an
+    # ordered list is cheaper than keying a dict of payload dicts
+    span_get = _VERBOSE_SPAN_GET if verbose else _SPAN_GET
+    field_names = _VERBOSE_SPAN_FIELD_NAMES if verbose else _SPAN_FIELD_NAMES
+    trace_keys = _VERBOSE_TRACE_KEYS if verbose else _TRACE_KEYS
+    trace_cls = VerboseTrace if verbose else Trace
+    seen = set()
+    trace_list = []
+    for edge in spans_edges:
+        if max_traces is not None and len(trace_list) >= max_traces:
+            break
+        node = edge["node"]
+        if strict:
+            trace_id = node["context"]["traceId"]
+        else:
+            trace_id = (node.get("context") or {}).get("traceId")
+        if trace_id and trace_id not in seen:
+            seen.add(trace_id)
+            if strict:
+                values = span_get(node)
+            else:
+                values = tuple(node.get(field) for field in field_names)
+            if trace_cls is not None:
+                trace = trace_cls(trace_id, *values)
+            else:
+                trace = {"trace_id": trace_id}
+                trace.update(zip(trace_keys, values))
+            trace_list.append(trace)
+
+    return {
+        "success": True,
+        "message": f"Found {len(trace_list)} traces in project '{project_name}'",
+        "traces": trace_list,
+        "count": len(trace_list),
+        "project": project_name,
+    }
+
+
+def _result_from_trace_edges(project_name, trace_edges):
+    """Build the tool's output dict from server-deduplicated trace nodes."""
+    trace_list = []
+    for edge in trace_edges:
+        node = edge.get("node", {})
+        root = node.get("rootSpan") or {}
+        values = tuple(root.get(field) for field in _SPAN_FIELD_NAMES)
+        if Trace is not None:
+            trace_list.append(Trace(node.get("traceId"), *values))
+        else:
+            trace = {"trace_id": node.get("traceId")}
+            trace.update(zip(_TRACE_KEYS, values))
+            trace_list.append(trace)
+
+    if not trace_list:
+        message = f"No traces found in project '{project_name}'"
+    else:
+        message = f"Found {len(trace_list)} traces in project '{project_name}'"
+
+    return {
+        "success": True,
+        "message": message,
+        "traces": trace_list,
+        "count": len(trace_list),
+        "project": project_name,
+    }
+
+
+def _fetch_traces_connection(project_name, limit, endpoint):
+    """Ask the server for distinct traces directly, when it can.
+
+    Lets the server do the per-trace dedup instead of shipping every
+    span and discarding duplicates in Python. A GraphQL error on the
+    first attempt marks the connection unsupported for the rest of the
+    process.
+
+    Returns:
+        The tool's output dict, or None when the connection is
+        unsupported or the project cannot be resolved
+    """
+    global _TRACES_CONNECTION_SUPPORTED  # pylint: disable=global-statement
+
+    if _TRACES_CONNECTION_SUPPORTED is False:
+        return None
+
+    project_id = get_project_id(project_name, endpoint)
+
+    if not project_id:
+        return None
+
+    response = execute_graphql_query(
+        endpoint, GET_PROJECT_TRACE_NODES_QUERY, {"projectId": project_id, "first": limit}
+    )
+
+    if response.status_code != 200 or response.data is None:
+        return None
+
+    result = response.data
+
+    if "errors" in result and result["errors"]:
+        _TRACES_CONNECTION_SUPPORTED = False
+        return None
+
+    _TRACES_CONNECTION_SUPPORTED = True
+    trace_edges = (
+        result.get("data", {}).get("project", {}).get("traces", {}).get("edges", [])
+    )
+    return _result_from_trace_edges(project_name, trace_edges)
+
+
+def _fetch_spans_fallback(project_name, limit, endpoint, verbose=False):
+    """Fetch span edges with the older two-call flow.
+
+    Returns:
+        List of span edges, or None if the project or spans could not
+        be resolved
+    """
+    project_id = get_project_id(project_name, endpoint)
+
+    if not project_id:
+        return None
+
+    query = GET_TRACES_QUERY_VERBOSE if verbose else GET_TRACES_QUERY
+    response = execute_graphql_query(
+        endpoint, query, {"projectId": project_id, "first": limit}
+    )
+
+    if response.status_code != 200 or response.data is None:
+        return None
+
+    result = response.data
+
+    if "errors" in result and result["errors"]:
+        return None
+
+    return result.get("data", {}).get("project", {}).get("spans", {}).get("edges", [])
+
+
+def _fetch_spans_paginated(project_name, target_traces, endpoint, verbose=False):
+    """Walk the spans connection page by page until enough traces are seen.
+
+    Uses the Relay first/after cursors so a project with many spans per
+    trace never ships every row at once; the loop stops as soon as
+    target_traces unique trace IDs have crossed the wire.
+
+    Returns:
+        List of span edges, or None if the project or spans could not
+        be resolved
+    """
+    project_id = get_project_id(project_name, endpoint)
+
+    if not project_id:
+        return None
+
+    query = GET_TRACES_QUERY_VERBOSE if verbose else GET_TRACES_QUERY
+    spans_edges = []
+    seen = set()
+    cursor = None
+
+    while True:
+        response = execute_graphql_query(
+            endpoint,
+            query,
+            {"projectId": project_id, "first": _PAGE_SIZE, "after": cursor},
+        )
+
+        if response.status_code != 200 or response.data is None:
+            return None
+
+        result = response.data
+
+        if "errors" in result and result["errors"]:
+            return None
+
+        spans = (
+            result.get("data", {}).get("project", {}).get("spans", {})
+        )
+        for edge in spans.get("edges", []):
+            spans_edges.append(edge)
+            trace_id = (edge["node"].get("context") or {}).get("traceId")
+            if trace_id:
+                seen.add(trace_id)
+
+        page_info = spans.get("pageInfo", {})
+        if len(seen) >= target_traces or not page_info.get("hasNextPage"):
+            return spans_edges
+        cursor = page_info.get("endCursor")
+
+
+def list_traces(
+    project_name,
+    limit=None,
+    filter_condition=None,
+    endpoint=None,
+    verbose=False,
+    target_traces=None,
+):
     """List traces from a Phoenix project using GraphQL API."""
 
-    if not endpoint:
-        endpoint = os.getenv("PHOENIX_HOST", "http://localhost:6006")
+    endpoint = endpoint or DEFAULT_ENDPOINT
+
+    query = GET_PROJECT_TRACES_QUERY_VERBOSE if verbose else GET_PROJECT_TRACES_QUERY
 
     try:
-        # First get the project ID
-        project_id = get_project_id(project_name, endpoint)
-
-        if not project_id:
-            return {
-                "success": False,
-                "message": f"Project '{project_name}' not found",
-                "traces": [],
-                "count": 0,
-                "project": project_name,
-            }
+        # With the schema confirmed by introspection, parsers can index
+        # responses directly instead of defensive .get chains
+        strict = "projects" in ensure_schema(endpoint)
 
-        # GraphQL query to get traces/spans for the project
-        # Build query with optional limit
-        limit_arg = f"first: {limit}" if limit else ""
+        # With a trace target, walk the cursor-paginated spans query and
+        # stop early instead of shipping the whole project at once
+        if target_traces is not None:
+            spans_edges = _fetch_spans_paginated(
+                project_name, target_traces, endpoint, verbose
+            )
+            if spans_edges is None:
+                return _error_result(
+                    project_name, f"Project '{project_name}' not found"
+                )
+            return _result_from_spans_edges(
+                project_name, spans_edges, verbose, strict, max_traces=target_traces
+            )
 
-        query = f"""
-        query GetTraces {{
-            project(id: "{project_id}") {{
-                spans({limit_arg}) {{
-                    edges {{
-                        node {{
-                            id
-                            context {{
-                                traceId
-                            }}
-                            name
-                            statusCode
-                            startTime
-                            endTime
-                            latencyMs
-                            tokenCountTotal
-                            tokenCountPrompt
-                            tokenCountCompletion
-                        }}
-                    }}
-                }}
-            }}
-        }}
-        """
+        # Prefer server-side trace dedup where the schema offers it; the
+        # traces connection only carries the lean field set, so --verbose
+        # stays on the spans path
+        if not verbose:
+            result = _fetch_traces_connection(project_name, limit, endpoint)
+            if result is not None:
+                return result
 
-        response = execute_graphql_query(endpoint, query)
+        # One round-trip: resolve the project and fetch its spans from a
+        # single nested query over the filtered projects listing
+        response = execute_graphql_query(
+            endpoint, query, {"name": project_name, "first": limit}
+        )
 
-        if response.status_code != 200:
-            return {
-                "success": False,
-                "message": f"HTTP error {response.status_code}: {response.text}",
-                "traces": [],
-                "count": 0,
-                "project": project_name,
-            }
+        if response.status_code != 200 or response.data is None:
+            return _error_result(
+                project_name,
+                f"HTTP error {response.status_code}: {response.text}",
+            )
 
-        result = response.json()
+        result = response.data
 
         if "errors" in result and result["errors"]:
-            return {
-                "success": False,
-                "message": f"GraphQL error: {result['errors'][0]['message']}",
-                "traces": [],
-                "count": 0,
-                "project": project_name,
-            }
+            # Older servers may reject the nested shape - fall back to
+            # the two sequential calls (project ID, then spans)
+            spans_edges = _fetch_spans_fallback(project_name, limit, endpoint, verbose)
+            if spans_edges is None:
+                return _error_result(
+                    project_name,
+                    f"GraphQL error: {result['errors'][0]['message']}",
+                )
+        else:
+            spans_edges, error = _extract_spans_edges(project_name, result, strict)
+            if error is not None:
+                return error
 
-        # Extract spans and group by trace ID
-        spans_edges = (
-            result.get("data", {}).get("project", {}).get("spans", {}).get("edges", [])
-        )
+        return _result_from_spans_edges(project_name, spans_edges, verbose, strict)
 
-        if not spans_edges:
-            return {
-                "success": True,
-                "message": f"No traces found in project '{project_name}'",
-                "traces": [],
-                "count": 0,
-                "project": project_name,
-            }
+    except Exception as e:
+        return _error_result(project_name, f"Error: {str(e)}")
 
-        # Group spans by trace ID to get unique traces
-        traces_dict = {}
-        for edge in spans_edges:
-            node = edge.get("node", {})
-            trace_id = node.get("context", {}).get("traceId")
-            if trace_id and trace_id not in traces_dict:
-                traces_dict[trace_id] = {
-                    "trace_id": trace_id,
-                    "first_span_name": node.get("name"),
-                    "start_time": node.get("startTime"),
-                    "latency_ms": node.get("latencyMs"),
-                    "token_count_total": node.get("tokenCountTotal"),
-                    "status_code": node.get("statusCode"),
-                }
 
-        trace_list = list(traces_dict.values())
+async def list_traces_async(
+    project_name,
+    limit=None,
+    filter_condition=None,
+    endpoint=None,
+    session=None,
+    verbose=False,
+    target_traces=None,
+):
+    """Async variant of list_traces over a shared aiohttp session.
 
-        return {
-            "success": True,
-            "message": f"Found {len(trace_list)} traces in project '{project_name}'",
-            "traces": trace_list,
-            "count": len(trace_list),
-            "project": project_name,
-        }
+    Callers scanning several projects can pass one ClientSession and fan
+    the GraphQL calls out with asyncio.gather; without a session a
+    short-lived one is created.
+    """
+
+    endpoint = endpoint or DEFAULT_ENDPOINT
+
+    query = GET_PROJECT_TRACES_QUERY_VERBOSE if verbose else GET_PROJECT_TRACES_QUERY
+
+    try:
+        # The introspection probe shares the sync session, so run it off
+        # the event loop; it only costs a round-trip once per process
+        loop = asyncio.get_running_loop()
+        root_fields = await loop.run_in_executor(None, ensure_schema, endpoint)
+        strict = "projects" in root_fields
+
+        # The cursor walk is inherently sequential, so run the sync
+        # pagination loop off the event loop rather than duplicating it
+        if target_traces is not None:
+            spans_edges = await loop.run_in_executor(
+                None,
+                _fetch_spans_paginated,
+                project_name,
+                target_traces,
+                endpoint,
+                verbose,
+            )
+            if spans_edges is None:
+                return _error_result(
+                    project_name, f"Project '{project_name}' not found"
+                )
+            return _result_from_spans_edges(
+                project_name, spans_edges, verbose, strict, max_traces=target_traces
+            )
+
+        # Same server-side dedup preference as the sync path, run off
+        # the event loop since the probe shares the sync session
+        if not verbose and _TRACES_CONNECTION_SUPPORTED is not False:
+            result = await loop.run_in_executor(
+                None, _fetch_traces_connection, project_name, limit, endpoint
+            )
+            if result is not None:
+                return result
+
+        variables = {"name": project_name, "first": limit}
+        if session is not None:
+            status, result = await async_execute_graphql_query(
+                session, endpoint, query, variables
+            )
+        else:
+            async with aiohttp.ClientSession() as own_session:
+                status, result = await async_execute_graphql_query(
+                    own_session, endpoint, query, variables
+                )
+
+        if status != 200:
+            return _error_result(project_name, f"HTTP error {status}: {result}")
+
+        if "errors" in result and result["errors"]:
+            # Reuse the sync two-call fallback off the event loop
+            spans_edges = await loop.run_in_executor(
+                None, _fetch_spans_fallback, project_name, limit, endpoint, verbose
+            )
+            if spans_edges is None:
+                return _error_result(
+                    project_name,
+                    f"GraphQL error: {result['errors'][0]['message']}",
+                )
+        else:
+            spans_edges, error = _extract_spans_edges(project_name, result, strict)
+            if error is not None:
+                return error
+
+        return _result_from_spans_edges(project_name, spans_edges, verbose, strict)
 
     except Exception as e:
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-            "traces": [],
-            "count": 0,
-            "project": project_name,
-        }
+        return _error_result(project_name, f"Error: {str(e)}")
+
+
+def list_traces_batch(
+    project_names,
+    endpoint=None,
+    max_workers=8,
+    verbose=False,
+    limit=None,
+    target_traces=None,
+):
+    """List traces for several projects with parallel GraphQL calls.
+
+    requests releases the GIL during I/O, so a small thread pool over
+    the shared session overlaps the per-project round-trips instead of
+    walking projects one by one. limit and target_traces apply to each
+    project individually. Lives here rather than graphql_utils to keep
+    the utilities free of tool-level imports.
+
+    Returns:
+        Dict mapping each project name to its list_traces result dict
+    """
+    fetch = partial(
+        list_traces,
+        limit=limit,
+        endpoint=endpoint,
+        verbose=verbose,
+        target_traces=target_traces,
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(fetch, project_names)
+    return dict(zip(project_names, results))
 
 
 def main():
     parser = argparse.ArgumentParser(description="List traces from a Phoenix project")
-    parser.add_argument("--project", required=True, help="Project name")
+    parser.add_argument("--project", help="Project name")
+    parser.add_argument(
+        "--all-projects",
+        action="store_true",
+        help="List traces for every project in parallel",
+    )
     parser.add_argument("--limit", type=int, help="Maximum number of traces to return")
     parser.add_argument(
         "--filter", dest="filter_condition", help="Filter condition for traces"
@@ -181,6 +718,16 @@ def main():
     parser.add_argument(
         "--endpoint", help="Phoenix server endpoint (default: from PHOENIX_HOST env)"
     )
+    parser.add_argument(
+        "--target-traces",
+        type=int,
+        help="Paginate spans and stop after this many unique traces",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Include span ID, end time, and token breakdown per trace",
+    )
     parser.add_argument(
         "--context", action="store_true", help="Return tool capabilities as JSON"
     )
@@ -188,14 +735,58 @@ def main():
     args = parser.parse_args()
 
     if args.context:
-        print(json.dumps(get_context(), indent=2))
+        _emit(get_context())
         return 0
 
-    # List traces
-    result = list_traces(args.project, args.limit, args.filter_condition, args.endpoint)
+    if not args.project and not args.all_projects:
+        parser.error("one of --project or --all-projects is required")
+
+    if args.all_projects:
+        projects_result = list_projects(args.endpoint)
+        if not projects_result["success"]:
+            _emit(projects_result)
+            return 1
+        names = [p["name"] for p in projects_result["projects"]]
+        batch = list_traces_batch(
+            names,
+            args.endpoint,
+            verbose=args.verbose,
+            limit=args.limit,
+            target_traces=args.target_traces,
+        )
+        result = {
+            "success": all(r["success"] for r in batch.values()),
+            "message": f"Listed traces for {len(batch)} projects",
+            "projects": batch,
+            "count": sum(r["count"] for r in batch.values()),
+        }
+        _emit(result)
+        return 0 if result["success"] else 1
+
+    # List traces, preferring the aiohttp path when available
+    if aiohttp is not None:
+        result = asyncio.run(
+            list_traces_async(
+                args.project,
+                args.limit,
+                args.filter_condition,
+                args.endpoint,
+                verbose=args.verbose,
+                target_traces=args.target_traces,
+            )
+        )
+    else:
+        result = list_traces(
+            args.project,
+            args.limit,
+            args.filter_condition,
+            args.endpoint,
+            verbose=args.verbose,
+            target_traces=args.target_traces,
+        )
 
     # Output as JSON for agent consumption
-    print(json.dumps(result, indent=2))
+    _emit(result)
 
     return 0 if result["success"] else 1
 